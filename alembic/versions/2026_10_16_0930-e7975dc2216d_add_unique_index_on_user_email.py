@@ -0,0 +1,26 @@
+"""Add unique index on user email
+
+Revision ID: e7975dc2216d
+Revises: 1606fadff157
+Create Date: 2026-10-16 09:30:12.418377
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7975dc2216d'
+down_revision: Union[str, None] = '1606fadff157'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f("ix_user_email"), "user", ["email"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_user_email"), table_name="user")
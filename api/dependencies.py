@@ -17,8 +17,9 @@ reusable_oauth2 = OAuth2PasswordBearer(
 )
 
 
+# expire_on_commit=False lets saved rows be returned without a refresh SELECT
 def get_db() -> Generator[Session, None, None]:
-    with Session(engine) as session:
+    with Session(engine, expire_on_commit=False) as session:
         yield session
 
 
@@ -29,7 +30,7 @@ TokenDependency = Annotated[str, Depends(reusable_oauth2)]
 def get_current_user(session: SessionDependency, token: TokenDependency) -> User:
     try:
         payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
+            token, settings.SECRET_KEY, algorithms=security.ALGORITHMS
         )
         token_data = TokenPayload(**payload)
     except (JWTError, ValidationError):
@@ -1,7 +1,6 @@
 # JD TODO: Create guest account logic
-from typing import Any
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import func, select
+from typing import Annotated, Any
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from api.dependencies import CurrentUser, get_current_user, SessionDependency
 from models.user import User, UserCreate, UserOut, UsersOut, UserUpdate
 from models.message import Message
@@ -15,16 +14,21 @@ router = APIRouter()
             dependencies=[Depends(get_current_user)],
             response_model=UsersOut
 )
-def read_users(session: SessionDependency, skip: int = 0, limit: int = 100) -> Any:
+def read_users(
+    session: SessionDependency,
+    skip: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1)] = 100,
+    after_id: int | None = None,
+) -> Any:
     """
-    Retrieve users.
+    Retrieve users, ordered by id. Pass the last id of the previous page as after_id
+    for keyset pagination instead of a growing skip.
     """
-    count_statement = select(func.count()).select_from(User)
-    count = session.exec(count_statement).one()
-
-    statement = select(User).offset(skip).limit(limit)
-    users = session.exec(statement).all()
-    return UsersOut(data=users, count=count)
+    users, count = utils.get_users_with_count(
+        session=session, skip=skip, limit=limit, after_id=after_id
+    )
+    # Plain dict so FastAPI validates once against response_model, stripping hashed_password
+    return {"data": users, "count": count}
 
 
 @router.get("/me", response_model=UserOut)
@@ -42,13 +46,13 @@ def read_user_by_id(
     """
     Get a specific user by id.
     """
+    if user_id == current_user.id:
+        return current_user
     user = session.get(User, user_id)
-    if user == current_user:
-        return user
-    if not current_user.is_active:
+    if not user:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="The user doesn't have enough privileges.",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found."
         )
     return user
 
@@ -108,18 +112,10 @@ def delete_user(
     """
     Delete a user.
     """
-    user = session.get(User, user_id)
-    if not user:
+    # JD TODO: add check for superuser deleting self once this is added
+    if not utils.delete_user(session=session, user_id=user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found."
         )
-    elif user != current_user and not current_user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="The user doesn't have enough privileges."
-        )
-    # JD TODO: add check for superuser deleting self once this is added
-    session.delete(user)
-    session.commit()
     return Message(message="User deleted successfully.")
\ No newline at end of file
@@ -1,4 +1,5 @@
-from sqlmodel import select, Session
+from functools import cache
+from sqlmodel import delete, func, select, Session
 from models.user import User, UserCreate, UserUpdate
 from core.security import get_password_hash, verify_password
 
@@ -9,7 +10,6 @@ def create_user(*, session: Session, user_create: UserCreate) -> User:
     )
     session.add(user)
     session.commit()
-    session.refresh(user)
     return user
 
 
@@ -19,24 +19,58 @@ def update_user(*, session: Session, user: User, user_in: UserUpdate) -> User:
     if "password" in user_data:
         password = user_data["password"]
         hashed_password = get_password_hash(password)
-        extra_data["password"] = hashed_password
+        extra_data["hashed_password"] = hashed_password
     
     user.sqlmodel_update(user_data, update=extra_data)
     session.add(user)
     session.commit()
-    session.refresh(user)
     return user
 
 
+# Single DELETE ... RETURNING round-trip instead of loading the row first
+def delete_user(*, session: Session, user_id: int) -> bool:
+    statement = delete(User).where(User.id == user_id).returning(User.id)
+    deleted_id = session.exec(statement).scalar_one_or_none()
+    if deleted_id is None:
+        return False
+    session.commit()
+    return True
+
+
+# Page of users plus total count in one query; after_id enables keyset paging
+def get_users_with_count(
+    *, session: Session, skip: int, limit: int, after_id: int | None = None
+) -> tuple[list[User], int]:
+    total = select(func.count()).select_from(User).correlate(None).scalar_subquery()
+    statement = select(User, total).order_by(User.id).offset(skip).limit(limit)
+    if after_id is not None:
+        statement = statement.where(User.id > after_id)
+    rows = session.exec(statement).all()
+    if rows:
+        return [user for user, _ in rows], rows[0][1]
+    if skip == 0 and after_id is None:
+        return [], 0
+    count_statement = select(func.count()).select_from(User)
+    return [], session.exec(count_statement).one()
+
+
 def get_user_by_email(*, session: Session, email: str) -> User | None:
     statement = select(User).where(User.email == email)
     session_user = session.exec(statement).first()
     return session_user
 
 
+# Hashed on first use rather than at import, since bcrypt is deliberately slow
+@cache
+def _dummy_password_hash() -> str:
+    return get_password_hash("campfire-dummy-password")
+
+
 def authenticate(*, session: Session, email: str, password: str) -> User | None:
     user = get_user_by_email(session=session, email=email)
     if not user:
+        # Same bcrypt work as a real check, so timing doesn't reveal unknown emails
+        verify_password(password, _dummy_password_hash())
         return None
     if not verify_password(password, user.hashed_password):
         return None
@@ -8,6 +8,7 @@ class Settings(BaseSettings):
     API_V_STR: str = "/api/v1"
     SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
+    BCRYPT_ROUNDS: int = 12
     BACKEND_CORS_ORIGINS: str
 
     PROJECT_NAME: str
@@ -16,6 +17,11 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
     POSTGRES_USER: str
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 5
+    DB_POOL_RECYCLE: int = 1800
+    DB_STATEMENT_TIMEOUT_MS: int = 5000
 
 
 settings = Settings()
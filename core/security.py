@@ -5,8 +5,13 @@ from passlib.context import CryptContext
 from core.config import settings
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Work factor is tunable per environment; hashes made at another cost still verify
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 ALGORITHM = "HS256"
+# Accepted algorithms when decoding, built once rather than per request
+ALGORITHMS = [ALGORITHM]
 
 
 # Create access token via HS256 encoding
@@ -1,5 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from api.main import api_router
 from core.config import settings
 
@@ -7,15 +9,24 @@ from core.config import settings
 campfire_api = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=settings.API_V_STR,
+    default_response_class=ORJSONResponse,
 )
 
 
+# Split the comma-separated setting once so CORS matches exact origins
+ALLOWED_ORIGINS = tuple(
+    origin.strip() for origin in settings.BACKEND_CORS_ORIGINS.split(",") if origin.strip()
+)
+
 campfire_api.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.BACKEND_CORS_ORIGINS,
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress larger payloads (e.g. user lists); small bodies aren't worth the CPU
+campfire_api.add_middleware(GZipMiddleware, minimum_size=1024)
+
 campfire_api.include_router(api_router, prefix="/api/v1")